@@ -17,7 +17,7 @@ import os.path
 import shutil
 import subprocess
 import functools
-import operator
+import itertools
 import concurrent.futures
 import csv
 
@@ -519,7 +519,7 @@ def order_and_orient(inFasta, inReference, outFasta,
                 'Number of reference segments must match the n_genome_segments parameter')
     else:
         n_genome_segments = len(ref_segments_all[0])
-    ref_segments_all = functools.reduce(operator.concat, ref_segments_all, ())
+    ref_segments_all = tuple(itertools.chain.from_iterable(ref_segments_all))
 
     n_refs = len(ref_segments_all) // n_genome_segments
     log.info('n_genome_segments={} n_refs={}'.format(n_genome_segments, n_refs))
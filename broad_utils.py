@@ -25,9 +25,8 @@ log = logging.getLogger(__name__)
 
 def get_json_from_picard(picardDir):
     ''' for example, /seq/walkup/picard/{flowcell_minus_first_char} '''
-    analysisDir = max(
-        (os.path.getmtime(os.path.join(picardDir, d)), d) for d in os.listdir(picardDir)
-        if os.path.isdir(os.path.join(picardDir, d)))[1]
+    with os.scandir(picardDir) as entries:
+        analysisDir = max((entry.stat().st_mtime, entry.name) for entry in entries if entry.is_dir())[1]
     jsonfile = list(glob.glob(os.path.join(picardDir, analysisDir, 'info', 'logs', '*.json')))
     if len(jsonfile) != 1:
         raise Exception("error")
@@ -1282,8 +1282,7 @@ def taxlevel_summary(summary_files_in, json_out, csv_out, tax_headings, taxlevel
         samples[sample_name] = sample_summary
 
     if json_out != None:
-        json_summary = json.dumps(samples, sort_keys=True, indent=4, separators=(',', ': '))
-        json_out.write(json_summary)
+        json.dump(samples, json_out, sort_keys=True, indent=4, separators=(',', ': '))
         json_out.close()
 
 
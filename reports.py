@@ -425,8 +425,9 @@ def get_lib_info(runfile):
 
 
 def get_earliest_date(inDir):
-    fnames = [inDir] + [os.path.join(inDir, x) for x in os.listdir(inDir)]
-    earliest = min(os.path.getmtime(fn) for fn in fnames)
+    with os.scandir(inDir) as entries:
+        mtimes = [entry.stat().st_mtime for entry in entries]
+    earliest = min([os.path.getmtime(inDir)] + mtimes)
     return time.strftime("%Y-%m-%d", time.localtime(earliest))
 
 
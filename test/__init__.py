@@ -7,7 +7,6 @@ import filecmp
 import os
 import re
 import unittest
-import hashlib
 import logging
 import copy
 
@@ -69,11 +68,6 @@ def assert_md5_equal_to_line_in_file(testCase, filename, checksum_file, msg=None
           compare md5(test_output.bam) with expected_output.bam.md5:1
     '''
 
-    hash_md5 = hashlib.md5()
-    with open(filename, "rb") as f:
-        for chunk in iter(lambda: f.read(4096), b""):
-            hash_md5.update(chunk)
-
     expected_checksum = ""
     with open(checksum_file, "rb") as f:
         expected_checksum = str(f.readline().decode("utf-8"))
@@ -82,7 +76,7 @@ def assert_md5_equal_to_line_in_file(testCase, filename, checksum_file, msg=None
 
     assert len(expected_checksum) > 0
 
-    testCase.assertEqual(hash_md5.hexdigest(), expected_checksum, msg=msg)
+    testCase.assertEqual(util.file.hash_file(filename, 'md5'), expected_checksum, msg=msg)
 
 @pytest.mark.usefixtures('tmpdir_class')
 class TestCaseWithTmp(unittest.TestCase):
@@ -71,6 +71,44 @@ def test_check_paths(tmpdir):
     util.file.make_empty(join(writable_dir, 'myempty.dat'))
     check_paths(read_and_write=join(writable_dir, 'myempty.dat'))
 
+def test_check_paths_error_types(tmpdir):
+    '''Test which errors util.file.check_paths() raises, and that it never creates files'''
+    from os.path import join
+    from util.file import check_paths
+    d = str(tmpdir)
+    readable = join(d, 'readable.txt')
+    util.file.dump_file(readable, 'data')
+
+    check_paths(read=readable)
+    with pytest.raises(IsADirectoryError):
+        check_paths(read=d)
+    with pytest.raises(FileNotFoundError):
+        check_paths(read=join(d, 'missing.txt'))
+
+    check_paths(write=join(d, 'new.txt'))
+    with pytest.raises(FileNotFoundError):
+        check_paths(write=join(d, 'no_such_dir', 'out.txt'))
+    with pytest.raises(NotADirectoryError):
+        check_paths(write=join(readable, 'out.txt'))
+
+    # writing through a dangling symlink needs the link target's directory to exist
+    os.symlink(join(d, 'no_such_dir', 'target.txt'), join(d, 'dangling_bad'))
+    with pytest.raises(FileNotFoundError):
+        check_paths(write=join(d, 'dangling_bad'))
+    os.symlink(join(d, 'target.txt'), join(d, 'dangling_ok'))
+    check_paths(write=join(d, 'dangling_ok'))
+    os.symlink(join(d, 'loop_b'), join(d, 'loop_a'))
+    os.symlink(join(d, 'loop_a'), join(d, 'loop_b'))
+    with pytest.raises(OSError):
+        check_paths(write=join(d, 'loop_a'))
+
+    # a FIFO with no writer would block open(); check_paths must not
+    fifo = join(d, 'in.fifo')
+    os.mkfifo(fifo)
+    check_paths(read=fifo)
+
+    assert sorted(os.listdir(d)) == ['dangling_bad', 'dangling_ok', 'in.fifo', 'loop_a', 'loop_b', 'readable.txt']
+
 def test_uncompressed_file_type():
     """Test util.file.uncompressed_file_type()"""
     uft = util.file.uncompressed_file_type
@@ -102,3 +140,38 @@ def test_string_to_file_name():
             t_path = os.path.join(tmp_d, util.file.string_to_file_name(test_fname, tmp_d))
             util.file.make_empty(t_path)
             assert os.path.isfile(t_path) and os.path.getsize(t_path) == 0
+
+def test_hash_file(tmpdir, monkeypatch):
+    '''Test util.file.hash_file() against hashlib on in-memory data'''
+    import hashlib
+    data = b'ACGT' * (1024*1024) + b'N'
+    fname = os.path.join(str(tmpdir), 'data.bin')
+    with open(fname, 'wb') as f:
+        f.write(data)
+    assert util.file.hash_file(fname) == hashlib.md5(data).hexdigest()
+    assert util.file.hash_file(fname, 'sha1') == hashlib.sha1(data).hexdigest()
+    # exercise the chunked readinto path even where hashlib.file_digest exists
+    monkeypatch.delattr(hashlib, 'file_digest', raising=False)
+    assert util.file.hash_file(fname, 'sha256', chunk_size=1000) == hashlib.sha256(data).hexdigest()
+    util.file.make_empty(fname)
+    assert util.file.hash_file(fname) == hashlib.md5(b'').hexdigest()
+
+def test_find_broken_symlinks(tmpdir):
+    '''Test util.file.is_broken_link() and util.file.find_broken_symlinks()'''
+    from os.path import join
+    root = str(tmpdir)
+    os.mkdir(join(root, 'sub'))
+    util.file.make_empty(join(root, 'sub', 'real.txt'))
+    os.symlink(join(root, 'sub', 'real.txt'), join(root, 'good_link'))
+    os.symlink(join(root, 'sub'), join(root, 'dir_link'))
+    os.symlink(join(root, 'sub', 'missing.txt'), join(root, 'sub', 'bad_link'))
+
+    assert not util.file.is_broken_link(join(root, 'sub', 'real.txt'))
+    assert not util.file.is_broken_link(join(root, 'sub'))
+    assert not util.file.is_broken_link(join(root, 'good_link'))
+    assert not util.file.is_broken_link(join(root, 'dir_link'))
+    assert not util.file.is_broken_link(join(root, 'does_not_exist'))
+    assert util.file.is_broken_link(join(root, 'sub', 'bad_link'))
+
+    assert util.file.find_broken_symlinks(root) == [join(root, 'sub', 'bad_link')]
+    assert util.file.find_broken_symlinks(join(root, 'sub', 'bad_link')) == [join(root, 'sub', 'bad_link')]
@@ -3,8 +3,6 @@
 '''
 
 import itertools
-import functools
-import operator
 import logging
 import os
 import os.path
@@ -50,9 +48,9 @@ class Gap2SeqTool(tools.Tool):
         abspath = os.path.abspath
         file_args = ('-s', abspath(scaffolds), '--filled', abspath(filled), 
                      '--reads', ','.join(map(abspath,reads)))
-        more_args = functools.reduce(operator.concat, 
-                                     [(('--' if len(arg) > 1 else '-') + arg.replace('_','-'), str(val))
-                                      for arg, val in kwargs.items()], ())
+        more_args = tuple(itertools.chain.from_iterable(
+            (('--' if len(arg) > 1 else '-') + arg.replace('_','-'), str(val))
+            for arg, val in kwargs.items()))
         with util.file.tmp_dir('_gap2seq_run_dir') as gap2seq_run_dir:
             with util.file.pushd_popd(gap2seq_run_dir):
                 self.execute(file_args+args+more_args)
@@ -86,7 +84,7 @@ class Gap2SeqTool(tools.Tool):
         """
         solid_kmer_thresholds = sorted(util.misc.make_seq(solid_kmer_thresholds), reverse=True)
         kmer_sizes = sorted(util.misc.make_seq(kmer_sizes), reverse=True)
-        stop_time = time.time() + 60*time_soft_limit_minutes
+        stop_time = time.monotonic() + 60*time_soft_limit_minutes
         threads = util.misc.sanitize_thread_count(threads, tool_max_cores_value=0)
         util.misc.chk(out_scaffold != in_scaffold)
         with tools.samtools.SamtoolsTool().bam2fq_tmp(in_bam) as reads, util.file.tmp_dir('_gap2seq_dir') as gap2seq_dir:
@@ -100,7 +98,7 @@ class Gap2SeqTool(tools.Tool):
                 if not any('N'*min_gap_to_close in str(rec.seq) for rec in Bio.SeqIO.parse(prev_scaffold, 'fasta')):
                     log.info('no gaps left, quittting gap2seq early')
                     break
-                if time.time() > stop_time:
+                if time.monotonic() > stop_time:
                     log.info('Time limit for gap closing reached')
                     break
 
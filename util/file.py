@@ -8,6 +8,7 @@ __author__ = "dpark@broadinstitute.org"
 import codecs
 import contextlib
 import os
+import stat
 import gzip
 import io
 import tempfile
@@ -21,6 +22,7 @@ import io
 import csv
 import inspect
 import tarfile
+import hashlib
 
 import util.cmd
 import util.misc
@@ -104,14 +106,28 @@ def check_paths(read=(), write=(), read_and_write=()):
     assert not (set(write) & set(read_and_write))
 
     for fname in read+read_and_write:
-        with open(fname):
-            pass
+        # one stat + access check, rather than opening the file
+        if stat.S_ISDIR(os.stat(fname).st_mode):
+            raise IsADirectoryError('Cannot read directory ' + fname)
+        if not os.access(fname, os.R_OK):
+            raise PermissionError('Cannot read ' + fname)
 
     for fname in write+read_and_write:
         if not os.path.exists(fname):
-            with open(fname, 'w'):
-                pass
-            os.unlink(fname)
+            # check the parent directory instead of creating and removing the file;
+            # writing to a dangling symlink creates its target, so check the target's directory
+            target = fname
+            if os.path.lexists(fname):
+                target = os.path.realpath(fname)
+                if os.path.islink(target):
+                    raise OSError(errno.ELOOP, 'Too many levels of symbolic links', fname)
+            dirname = os.path.dirname(target) or '.'
+            if not os.path.isdir(dirname):
+                if os.path.exists(dirname):
+                    raise NotADirectoryError('Not a directory: ' + dirname)
+                raise FileNotFoundError('Directory does not exist: ' + dirname)
+            if not os.access(dirname, os.W_OK | os.X_OK):
+                raise PermissionError('Cannot write ' + fname)
         else:
             if not (os.path.isfile(fname) and os.access(fname, os.W_OK)):
                 raise PermissionError('Cannot write ' + fname)
@@ -849,15 +865,34 @@ def slurp_file(fname, maxSizeMb=50):
     with open_or_gzopen(fname) as f:
         return f.read()
 
+def hash_file(fname, hash_algorithm='md5', chunk_size=1024*1024):
+    """Return the hex digest of the contents of `fname`, computed with `hash_algorithm` (any name accepted by
+    hashlib.new).  The file is read in large chunks into a reusable buffer, so that the bulk of the work happens
+    inside hashlib rather than in Python-level byte handling.  On python 3.11+ hashlib.file_digest does the reading,
+    and `chunk_size` only applies when it is unavailable."""
+    with open(fname, 'rb') as f:
+        if hasattr(hashlib, 'file_digest'):
+            # python 3.11+
+            return hashlib.file_digest(f, hash_algorithm).hexdigest()
+        h = hashlib.new(hash_algorithm)
+        buf = bytearray(chunk_size)
+        view = memoryview(buf)
+        while True:
+            n = f.readinto(buf)
+            if not n:
+                break
+            h.update(view[:n])
+        return h.hexdigest()
+
 def is_broken_link(filename):
-    # isfile() returns True if a file, or a working link
-    if os.path.isfile(filename) or os.path.isdir(filename):
+    # a single lstat() tells us whether this is a link at all; only links need their target resolved
+    try:
+        if not stat.S_ISLNK(os.lstat(filename).st_mode):
+            return False
+    except OSError:
         return False
-    # otherwise if this is a link
-    if os.path.islink(filename):
-        # os.path.exists() returns false in the case of broken symlinks
-        return not os.path.exists(filename)
-    return False
+    # os.path.exists() returns false in the case of broken symlinks
+    return not os.path.exists(filename)
 
 
 def find_broken_symlinks(rootdir, followlinks=False):
@@ -26,11 +26,9 @@ def get_project_path():
 
 
 def call_git_describe():
-    cwd = os.getcwd()
     try:
-        os.chdir(get_project_path())
         cmd = ['git', 'describe', '--tags', '--always', '--dirty']
-        result = util.misc.run_and_print(cmd, silent=True)
+        result = util.misc.run_and_print(cmd, silent=True, cwd=get_project_path())
         ver = None
         if result.returncode == 0:
             out = result.stdout    
@@ -39,7 +37,6 @@ def call_git_describe():
             ver = out.strip()
     except Exception:
         ver = None
-    os.chdir(cwd)
     return ver
 
 